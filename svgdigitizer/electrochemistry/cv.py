@@ -48,7 +48,6 @@ For the documentation below, the path of a CV is presented simply as a line.
 import logging
 from functools import cached_property
 
-import matplotlib.pyplot as plt
 from astropy import units as u
 
 from svgdigitizer.svgfigure import SVGFigure
@@ -178,14 +177,57 @@ class CV(SVGFigure):
             measurement_type=measurement_type,
             force_si_units=force_si_units,
         )
-        assert self.svgplot.xlabel in [
+        self.check_axis_labels(self.svgplot)
+
+    @classmethod
+    def check_axis_labels(cls, svgplot):
+        r"""
+        Verify that the axes of `svgplot` are labeled like the axes of a CV,
+        i.e., potential/voltage on the x-axis and current (density) on the
+        y-axis.
+
+        EXAMPLES::
+
+            >>> from svgdigitizer.svg import SVG
+            >>> from svgdigitizer.svgplot import SVGPlot
+            >>> from io import StringIO
+            >>> svg = SVG(StringIO(r'''
+            ... <svg>
+            ...   <g>
+            ...     <path d="M 0 100 L 100 0" />
+            ...     <text x="0" y="0">curve: 0</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 0 200 L 0 100" />
+            ...     <text x="0" y="200">T1: 0 K</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M 100 200 L 100 100" />
+            ...     <text x="100" y="200">T2: 1 K</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 100 L 0 100" />
+            ...     <text x="-100" y="100">j1: 0 uA / cm2</text>
+            ...   </g>
+            ...   <g>
+            ...     <path d="M -100 0 L 0 0" />
+            ...     <text x="-100" y="0">j2: 1 uA / cm2</text>
+            ...   </g>
+            ... </svg>'''))
+            >>> CV.check_axis_labels(SVGPlot(svg))
+            Traceback (most recent call last):
+            ...
+            AssertionError: The y-label must be 'E' or 'U and not 'T'.
+
+        """
+        assert svgplot.xlabel in [
             "U",
             "E",
-        ], f"The y-label must be 'E' or 'U and not '{self.svgplot.xlabel}'."
-        assert self.svgplot.ylabel in [
+        ], f"The y-label must be 'E' or 'U and not '{svgplot.xlabel}'."
+        assert svgplot.ylabel in [
             "I",
             "j",
-        ], f"The y-label must be 'I' or 'j and not '{self.svgplot.ylabel}'."
+        ], f"The y-label must be 'I' or 'j and not '{svgplot.ylabel}'."
 
     @property
     def data_schema(self):
@@ -327,26 +369,44 @@ class CV(SVGFigure):
                         {'name': 'j', 'type': 'number', 'unit': 'uA / cm2', 'orientation': 'y'}]}
 
         """
-        import re
-
         from frictionless import Schema
 
         schema = Schema.from_descriptor(super().figure_schema.to_dict())
 
-        pattern = r"^(?P<unit>.+?)? *(?:(?:@|vs\.?) *(?P<reference>.+))?$"
-        match = re.match(
-            pattern,
-            schema.get_field(self.svgplot.xlabel).custom["unit"],
-            re.IGNORECASE,
+        unit, reference = self.parse_potential_unit(
+            schema.get_field(self.svgplot.xlabel).custom["unit"]
         )
 
         schema.update_field(
             self.svgplot.xlabel,
-            {"unit": match[1], "reference": match[2] or "unknown"},
+            {"unit": unit, "reference": reference},
         )
 
         return schema
 
+    @classmethod
+    def parse_potential_unit(cls, unit):
+        r"""
+        Return the actual unit and the reference electrode encoded in the
+        `unit` of a potential/voltage axis label.
+
+        EXAMPLES::
+
+            >>> CV.parse_potential_unit('mV vs. RHE')
+            ('mV', 'RHE')
+            >>> CV.parse_potential_unit('V @ Ag/AgCl')
+            ('V', 'Ag/AgCl')
+            >>> CV.parse_potential_unit('V')
+            ('V', 'unknown')
+
+        """
+        import re
+
+        pattern = r"^(?P<unit>.+?)? *(?:(?:@|vs\.?) *(?P<reference>.+))?$"
+        match = re.match(pattern, unit, re.IGNORECASE)
+
+        return match[1], match[2] or "unknown"
+
     def plot(self):
         r"""
         Visualize the digitized cyclic voltammogram with values in SI units.
@@ -385,6 +445,8 @@ class CV(SVGFigure):
             >>> cv.plot()
 
         """
+        import matplotlib.pyplot as plt
+
         super().plot()
 
         plt.xlabel(
@@ -40,6 +40,7 @@ EXAMPLES::
 # ********************************************************************
 import logging
 import os
+from functools import lru_cache
 
 import click
 
@@ -116,6 +117,15 @@ def _outfile(template, suffix=None, outdir=None):
         ...     os.path.exists(os.path.join(directory, "subdirectory", "xy.csv"))
         True
 
+    TESTS:
+
+    Only the last suffix is replaced for files that contain more dots::
+
+        >>> with TemporaryData() as directory:
+        ...     outname = _outfile(os.path.join(directory, "plot.v1.pdf"), suffix="_p0.png")
+        ...     os.path.basename(outname)
+        'plot.v1_p0.png'
+
     """
     if suffix is not None:
         template = f"{os.path.splitext(template)[0]}{suffix}"
@@ -128,10 +138,48 @@ def _outfile(template, suffix=None, outdir=None):
     return template
 
 
+def _parse_svg(svg):
+    r"""
+    Return the :class:`SVG` stored in the file at the path `svg`.
+
+    Parsed SVGs are cached as long as the file does not change on disk, so
+    that digitizing the same SVG repeatedly in the same process, e.g., with
+    different sampling intervals, only parses it once. This is safe since
+    the SVG is not modified by the plots built from it.
+
+    EXAMPLES::
+
+        >>> from svgdigitizer.test.cli import TemporaryData
+        >>> with TemporaryData("**/xy.svg") as directory:
+        ...     svg = os.path.join(directory, "xy.svg")
+        ...     _parse_svg(svg) is _parse_svg(svg)
+        True
+
+    """
+    stat = os.stat(svg)
+    return _parse_svg_file(os.path.realpath(svg), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_svg_file(path, mtime, size):  # pylint: disable=unused-argument
+    r"""
+    Return the :class:`SVG` stored in the file at `path`.
+
+    The modification time `mtime` and the `size` of the file are not used
+    but only serve to invalidate the cache of :meth:`_parse_svg`.
+    """
+    from svgdigitizer.svg import SVG
+
+    with open(path, mode="rb") as infile:
+        return SVG(infile)
+
+
 def _create_svgplot(svg, sampling_interval, skewed):
     r"""
     Return an :class:`SVGPlot` as read from the stream `svg`.
 
+    Instead of a stream, `svg` can also be an already parsed :class:`SVG`.
+
     EXAMPLES::
 
         >>> from svgdigitizer.test.cli import invoke, TemporaryData
@@ -141,12 +189,25 @@ def _create_svgplot(svg, sampling_interval, skewed):
         ...         _create_svgplot(infile, sampling_interval=None, skewed=False)
         <svgdigitizer.svgplot.SVGPlot object at 0x...>
 
+    ::
+
+        >>> from svgdigitizer.svg import SVG
+        >>> with TemporaryData("**/xy.svg") as directory:
+        ...     svg = os.path.join(directory, "xy.svg")
+        ...     with open(svg, mode="rb") as infile:
+        ...         svg = SVG(infile)
+        >>> _create_svgplot(svg, sampling_interval=None, skewed=False)
+        <svgdigitizer.svgplot.SVGPlot object at 0x...>
+
     """
     from svgdigitizer.svg import SVG
     from svgdigitizer.svgplot import SVGPlot
 
+    if not isinstance(svg, SVG):
+        svg = SVG(svg)
+
     return SVGPlot(
-        SVG(svg),
+        svg,
         sampling_interval=sampling_interval,
         algorithm="mark-aligned" if skewed else "axis-aligned",
     )
@@ -185,6 +246,30 @@ def _create_bibliography(svg, metadata):
     return bibliography.entries[bibkey].to_string("bibtex")
 
 
+def _load_metadata(metadata):
+    r"""
+    Return the metadata parsed from the YAML stream `metadata`.
+
+    This is a helper method for the commands that accept a `--metadata` file.
+
+    EXAMPLES::
+
+        >>> from io import StringIO
+        >>> _load_metadata(StringIO("source:\n  citation key: key\ncuration:\n  date: 2021-07-09"))
+        {'source': {'citation key': 'key'}, 'curation': {'date': datetime.date(2021, 7, 9)}}
+
+    """
+    import yaml
+
+    # Use the much faster LibYAML based loader when it is available.
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    return yaml.load(metadata, Loader=SafeLoader)
+
+
 @click.command()
 @sampling_interval_option
 @skewed_option
@@ -224,12 +309,11 @@ def digitize(svg, sampling_interval, outdir, skewed):
         ...     invoke(cli, "digitize", os.path.join(directory, "xy_rate.svg"))
 
     """
-    with open(svg, mode="rb") as infile:
-        svg_plot = _create_svgplot(
-            infile, sampling_interval=sampling_interval, skewed=skewed
-        )
+    svg_plot = _create_svgplot(
+        _parse_svg(svg), sampling_interval=sampling_interval, skewed=skewed
+    )
 
-    svg_plot.df.to_csv(_outfile(svg, suffix=".csv", outdir=outdir), index=False)
+    _write_csv(svg_plot.df, _outfile(svg, suffix=".csv", outdir=outdir))
 
 
 @click.command(name="figure")
@@ -286,18 +370,17 @@ def digitize_figure(
 
     """
     if metadata:
-        import yaml
-
-        metadata = yaml.load(metadata, Loader=yaml.SafeLoader)
+        metadata = _load_metadata(metadata)
 
-    with open(svg, mode="rb") as infile:
-        from svgdigitizer.svgfigure import SVGFigure
+    from svgdigitizer.svgfigure import SVGFigure
 
-        svgfigure = SVGFigure(
-            _create_svgplot(infile, sampling_interval=sampling_interval, skewed=skewed),
-            metadata=metadata,
-            force_si_units=si_units,
-        )
+    svgfigure = SVGFigure(
+        _create_svgplot(
+            _parse_svg(svg), sampling_interval=sampling_interval, skewed=skewed
+        ),
+        metadata=metadata,
+        force_si_units=si_units,
+    )
 
     _create_outfiles(
         svgfigure=svgfigure, svg=svg, outdir=outdir, bibliography=bibliography
@@ -357,34 +440,43 @@ def digitize_cv(
         >>> with TemporaryData("**/xy_rate.svg") as directory:
         ...     invoke(cli, "cv", os.path.join(directory, "xy_rate.svg"))
 
+    The command fails when the x-axis is not a potential, also when a sampling
+    interval needs to be converted to volts::
+
+        >>> with TemporaryData("**/figure_bibliography.svg") as directory:
+        ...     invoke(cli, "cv", "--sampling-interval", "0.01", os.path.join(directory, "figure_bibliography.svg"))
+        Traceback (most recent call last):
+        ...
+        AssertionError: The y-label must be 'E' or 'U and not 'T'.
+
     """
     from svgdigitizer.electrochemistry.cv import CV
 
+    # The SVG is not modified by the plots built from it, so we only need to
+    # parse it once.
+    document = _parse_svg(svg)
+
     if sampling_interval is not None:
         # Rewrite the sampling interval in terms of the unit on the x-axis.
-        with open(svg, mode="rb") as infile:
-            cv = CV(
-                _create_svgplot(infile, sampling_interval=None, skewed=skewed),
-                force_si_units=si_units,
-            )
+        # The unit is read from the axis labels directly, so we do not need to
+        # digitize the curve (without sampling) to determine it.
+        svgplot = _create_svgplot(document, sampling_interval=None, skewed=skewed)
+        CV.check_axis_labels(svgplot)
 
-            from astropy import units as u
+        from astropy import units as u
 
-            sampling_interval /= u.Unit(
-                cv.figure_schema.get_field(cv.svgplot.xlabel).custom["unit"]
-            ).to(u.V)
+        sampling_interval /= u.Unit(
+            CV.parse_potential_unit(svgplot.axis_labels[svgplot.xlabel] or "")[0]
+        ).to(u.V)
 
     if metadata:
-        import yaml
-
-        metadata = yaml.load(metadata, Loader=yaml.SafeLoader)
+        metadata = _load_metadata(metadata)
 
-    with open(svg, mode="rb") as infile:
-        svgfigure = CV(
-            _create_svgplot(infile, sampling_interval=sampling_interval, skewed=skewed),
-            metadata=metadata,
-            force_si_units=si_units,
-        )
+    svgfigure = CV(
+        _create_svgplot(document, sampling_interval=sampling_interval, skewed=skewed),
+        metadata=metadata,
+        force_si_units=si_units,
+    )
 
     _create_outfiles(
         svgfigure=svgfigure, svg=svg, outdir=outdir, bibliography=bibliography
@@ -397,7 +489,7 @@ def _create_outfiles(svgfigure, svg, outdir, bibliography):
     This is a helper method for CLI commands that digitize an svgfigure.
     """
     csvname = _outfile(svg, suffix=".csv", outdir=outdir)
-    svgfigure.df.to_csv(csvname, index=False)
+    _write_csv(svgfigure.df, csvname)
 
     metadata = svgfigure.metadata
 
@@ -412,7 +504,7 @@ def _create_outfiles(svgfigure, svg, outdir, bibliography):
 
         metadata["source"].update({"bibdata": _create_bibliography(svg, metadata)})
 
-    package = _create_package(metadata, csvname, outdir)
+    package = _create_package(metadata, svgfigure.df, csvname, outdir)
 
     with open(
         _outfile(svg, suffix=".json", outdir=outdir),
@@ -422,24 +514,53 @@ def _create_outfiles(svgfigure, svg, outdir, bibliography):
         _write_metadata(json, package.to_dict())
 
 
-def _create_package(metadata, csvname, outdir):
+def _write_csv(df, csvname):
     r"""
-    Return a data package built from a :param:`metadata` dict and tabular data
-    in :param:`csvname`.
+    Write the data frame `df` to the CSV file `csvname`.
+
+    This is a helper method for :meth:`digitize` and :meth:`_create_outfiles`.
+
+    EXAMPLES::
+
+        >>> import pandas as pd
+        >>> from svgdigitizer.test.cli import TemporaryData
+        >>> with TemporaryData() as directory:
+        ...     csvname = os.path.join(directory, "data.csv")
+        ...     _write_csv(pd.DataFrame({"x": [0.0, 1.5], "y": [1e-6, 2.0]}), csvname)
+        ...     with open(csvname, encoding="utf-8") as csv:
+        ...         print(csv.read(), end="")
+        x,y
+        0.0,1e-06
+        1.5,2.0
+
+    """
+    # We keep pandas' float formatting since it produces the shortest
+    # representation that round-trips. A fixed printf-style format would
+    # either lose precision or write unnecessarily long numbers.
+    df.to_csv(csvname, index=False)
+
+
+def _create_package(metadata, df, csvname, outdir):
+    r"""
+    Return a data package built from a :param:`metadata` dict and the tabular
+    data `df` which has been written to :param:`csvname`.
 
     This is a helper method for :meth:`_create_outfiles`.
     """
     from frictionless import Package, Resource, Schema
 
+    # We know the data that has been written to the CSV, so we do not let
+    # frictionless read the CSV again to infer its encoding and schema.
     package = Package(
         resources=[
             Resource(
                 path=os.path.basename(csvname),
                 basepath=outdir or os.path.dirname(csvname),
+                encoding="utf-8",
+                schema=_create_schema(df),
             )
         ],
     )
-    package.infer()
     resource = package.resources[0]
 
     resource.custom.setdefault("metadata", {})
@@ -468,6 +589,48 @@ def _create_package(metadata, csvname, outdir):
     return package
 
 
+def _create_schema(df):
+    r"""
+    Return a frictionless schema describing the columns of `df`.
+
+    Boolean columns are of type ``boolean``, integer columns of type
+    ``integer``, floating point columns of type ``number``, and all other
+    columns of type ``string``.
+
+    This is a helper method for :meth:`_create_package`.
+
+    EXAMPLES::
+
+        >>> import pandas as pd
+        >>> _create_schema(pd.DataFrame({"t": [0.0], "n": [1], "flag": [True], "label": ["a"]}))  # doctest: +NORMALIZE_WHITESPACE
+        {'fields': [{'name': 't', 'type': 'number'},
+                    {'name': 'n', 'type': 'integer'},
+                    {'name': 'flag', 'type': 'boolean'},
+                    {'name': 'label', 'type': 'string'}]}
+
+    """
+    from frictionless import Schema
+    from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype
+
+    def field_type(dtype):
+        if is_bool_dtype(dtype):
+            return "boolean"
+        if is_integer_dtype(dtype):
+            return "integer"
+        if is_float_dtype(dtype):
+            return "number"
+        return "string"
+
+    return Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": name, "type": field_type(dtype)}
+                for name, dtype in df.dtypes.items()
+            ]
+        }
+    )
+
+
 def _write_metadata(out, metadata):
     r"""
     Write `metadata` to the `out` stream in JSON format.
@@ -492,51 +655,93 @@ def _write_metadata(out, metadata):
 
     import json
 
-    json.dump(metadata, out, default=defaultconverter, ensure_ascii=False, indent=4)
-    # json.dump does not save files with a newline, which compromises the tests
-    # where the output files are compared to an expected json.
-    out.write("\n")
+    # Encode the entire document at once so that it is written with a single
+    # call instead of one write for each token as json.dump would do.
+    # We also add a final newline since the tests compare the output to an
+    # expected json which ends in a newline.
+    out.write(
+        json.dumps(metadata, default=defaultconverter, ensure_ascii=False, indent=4)
+        + "\n"
+    )
+
+
+# The SVG written by :meth:`_create_linked_svg`.
+_LINKED_SVG_TEMPLATE = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg"'
+    ' xmlns:ev="http://www.w3.org/2001/xml-events"'
+    ' xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"'
+    ' xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"'
+    ' xmlns:xlink="http://www.w3.org/1999/xlink"'
+    ' baseProfile="full" height="{height}px" version="1.1" width="{width}px">\n'
+    "  <defs/>\n"
+    '  <image height="{height}px" sodipodi:insensitive="true" width="{width}px"'
+    ' x="0" xlink:href={href} y="0"/>\n'
+    "</svg>\n"
+)
 
 
-def _create_linked_svg(svg, png):
+def _create_linked_svg(svg, png, size):
     r"""
-    Write an SVG to `svg` that shows `png` as a linked image.
+    Write an SVG to `svg` that shows `png` of dimensions `size` as a linked
+    image.
 
     This is a helper method for :meth:`paginate`.
-    """
-    from PIL import Image
 
-    width, height = Image.open(png).size
+    EXAMPLES::
 
-    import svgwrite
+        >>> from svgdigitizer.test.cli import TemporaryData
+        >>> with TemporaryData() as directory:
+        ...     svg = os.path.join(directory, "page.svg")
+        ...     _create_linked_svg(svg, "page.png", (600, 800))
+        ...     with open(svg, encoding="utf-8") as infile:
+        ...         print(infile.read(), end="")  # doctest: +NORMALIZE_WHITESPACE
+        <?xml version="1.0" encoding="utf-8" ?>
+        <svg xmlns="http://www.w3.org/2000/svg" xmlns:ev="http://www.w3.org/2001/xml-events"
+             xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+             xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+             xmlns:xlink="http://www.w3.org/1999/xlink" baseProfile="full" height="800px" version="1.1" width="600px">
+          <defs/>
+          <image height="800px" sodipodi:insensitive="true" width="600px" x="0" xlink:href="page.png" y="0"/>
+        </svg>
 
-    drawing = svgwrite.Drawing(
-        svg,
-        size=(f"{width}px", f"{height}px"),
-        profile="full",
-    )
+    """
+    from xml.sax.saxutils import quoteattr
+
+    width, height = size
+
+    # The SVG is the same for all pages except for the size and the linked
+    # image, so we fill in a fixed template. The image is locked
+    # (sodipodi:insensitive) so that it cannot be moved accidentally when
+    # tracing the plot in Inkscape.
+    with open(svg, mode="w", encoding="utf-8") as out:
+        out.write(
+            _LINKED_SVG_TEMPLATE.format(
+                width=width, height=height, href=quoteattr(png, {'"': "&quot;"})
+            )
+        )
 
-    from svgwrite.extensions.inkscape import Inkscape
 
-    Inkscape(drawing)
+def _emit_page(page, png, svg):
+    r"""
+    Move the PNG `page` rendered by pdftoppm to `png` and, if `svg` is not
+    ``None``, write an SVG to `svg` that shows `png` as a linked image.
 
-    img = drawing.add(
-        svgwrite.image.Image(
-            png,
-            insert=(0, 0),
-            size=(f"{width}px", f"{height}px"),
-        )
-    )
+    This is a helper method for :meth:`paginate`.
+    """
+    # The page has already been encoded as a PNG by pdftoppm, so we do not
+    # decode and encode it again but just move it into place.
+    os.replace(page, png)
+
+    if svg is not None:
+        from PIL import Image
 
-    # workaround: add missing locking attribute for image element
-    # https://github.com/mozman/svgwrite/blob/c8cbf6f615910b3818ccf939fce0e407c9c789cb/svgwrite/extensions/inkscape.py#L50
-    elements = drawing.validator.elements
-    elements["image"].valid_attributes = {
-        "sodipodi:insensitive",
-    } | elements["image"].valid_attributes
-    img.attribs["sodipodi:insensitive"] = "true"
+        # The page comes as a path from pdftoppm, so we need to open it to
+        # determine its size. This only reads the header of the PNG.
+        with Image.open(png) as image:
+            size = image.size
 
-    drawing.save(pretty=True)
+        _create_linked_svg(svg, png, size)
 
 
 @click.command()
@@ -562,19 +767,41 @@ def paginate(onlypng, pdf, outdir):
         ...     invoke(cli, "paginate", os.path.join(directory, "mustermann_2021_svgdigitizer_1.pdf"))
 
     """
-    from pdf2image import convert_from_path
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
 
-    pages = convert_from_path(pdf, dpi=600)
-    pngs = [
-        _outfile(pdf, suffix=f"_p{page}.png", outdir=outdir)
-        for page in range(len(pages))
-    ]
-
-    for page, png in zip(pages, pngs):
-        page.save(png, "PNG")
+    from pdf2image import convert_from_path
 
-        if not onlypng:
-            _create_linked_svg(_outfile(png, suffix=".svg", outdir=outdir), png)
+    # Render the pages with several pdftoppm processes in parallel. The
+    # rendered pages are written to a temporary directory instead of being
+    # kept in memory, since a single page at 600 DPI takes about 100 MB. The
+    # temporary directory is created next to the output files so that the
+    # pages can be moved there without copying them. It has a recognizable
+    # name so that leftovers of interrupted runs can be spotted and removed.
+    with tempfile.TemporaryDirectory(
+        prefix=".svgdigitizer-paginate-",
+        dir=os.path.dirname(_outfile(pdf, outdir=outdir)) or ".",
+    ) as tmp:
+        pages = convert_from_path(
+            pdf,
+            dpi=600,
+            thread_count=os.cpu_count() or 1,
+            output_folder=tmp,
+            fmt="png",
+            paths_only=True,
+        )
+        pngs = [
+            _outfile(pdf, suffix=f"_p{page}.png", outdir=outdir)
+            for page in range(len(pages))
+        ]
+        svgs = [
+            None if onlypng else _outfile(png, suffix=".svg", outdir=outdir)
+            for png in pngs
+        ]
+
+        # Finalizing a page is mostly I/O, so threads suffice to overlap it.
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(_emit_page, pages, pngs, svgs))
 
 
 cli.add_command(plot)
@@ -73,7 +73,9 @@ class SVG:
 
     EXAMPLES:
 
-    An SVG can be created from a string or from a (file) stream::
+    An SVG can be created from a string or from a (file) stream. A stream is
+    parsed incrementally, i.e., it is not read into memory completely
+    before parsing::
 
         >>> svg = SVG(r'''
         ... <svg>
@@ -31,7 +31,6 @@ import logging
 from functools import cached_property
 
 import astropy.units as u
-import matplotlib.pyplot as plt
 
 from svgdigitizer.exceptions import SVGAnnotationError
 
@@ -1687,6 +1686,7 @@ class SVGFigure:
             >>> figure.plot()
 
         """
+        import matplotlib.pyplot as plt
 
         self.df.plot(
             x=self.svgplot.xlabel,